@@ -1031,24 +1031,38 @@ def _check_variable_access_ordered_inner(kernel):
 
     # {{{ populate 'dep_reqs_to_vars'
 
+    # Written variables in the same aliasing equivalence class and address
+    # space share their readers and writers, so the pairs of instructions
+    # accessing them need only be enumerated once per such group.
+    var_groups = {}
     for var in kernel.get_written_variables():
-        address_space = _get_address_space(kernel, var)
-        eq_class = aliasing_equiv_classes[var]
-
-        readers = set.union(
-                *[rmap.get(eq_name, set()) for eq_name in eq_class])
-        writers = set.union(
-                *[wmap.get(eq_name, set()) for eq_name in eq_class])
+        var_groups.setdefault(
+                (frozenset(aliasing_equiv_classes[var]),
+                    _get_address_space(kernel, var)),
+                set()).add(var)
+
+    for (eq_class, address_space), group_vars in var_groups.items():
+        readers = set()
+        writers = set()
+        for eq_name in eq_class:
+            readers.update(rmap.get(eq_name, ()))
+            writers.update(wmap.get(eq_name, ()))
+        accessors = readers | writers
+
+        if len(accessors) < 2:
+            # a sole accessor cannot need ordering with respect to anything
+            continue
 
         for writer in writers:
-            required_deps = (readers | writers) - {writer}
             required_deps = {req_dep
-                for req_dep in required_deps
-                if not declares_nosync_with(kernel, address_space, writer,
+                for req_dep in accessors
+                if req_dep != writer
+                and not declares_nosync_with(kernel, address_space, writer,
                     req_dep)}
 
             for req_dep in required_deps:
-                dep_reqs_to_vars.setdefault((writer, req_dep), set()).add(var)
+                dep_reqs_to_vars.setdefault(
+                        (writer, req_dep), set()).update(group_vars)
 
     # }}}
 
@@ -1649,6 +1649,10 @@ class DependencyTracker:
         # If target is an insn ID, look up the actual instruction.
         target = self.kernel.id_to_insn.get(target, target)
 
+        # Sources commonly show up for both access directions below (and for
+        # several variables), share their dependency descriptions.
+        source_id_to_dep_descr = {}
+
         for (
                 tgt_dir, src_dir, src_base_var_to_accessor_map
                 ) in [
@@ -1657,10 +1661,13 @@ class DependencyTracker:
                 ]:
 
             yield from self.get_conflicting_accesses(
-                    target, tgt_dir, src_dir, src_base_var_to_accessor_map)
+                    target, tgt_dir, src_dir, src_base_var_to_accessor_map,
+                    source_id_to_dep_descr)
 
     def get_conflicting_accesses(self, target, tgt_dir, src_dir,
-            src_base_var_to_accessor_map):
+            src_base_var_to_accessor_map, source_id_to_dep_descr=None):
+        if source_id_to_dep_descr is None:
+            source_id_to_dep_descr = {}
 
         def get_written_names(insn):
             return set(insn.assignee_var_names()) & self.relevant_vars
@@ -1677,33 +1684,42 @@ class DependencyTracker:
                     if (self.temp_to_base_storage.get(name, name)
                         == base_storage_name)}
 
+        def get_dep_descr(source_id):
+            try:
+                return source_id_to_dep_descr[source_id]
+            except KeyError:
+                pass
+
+            # no barrier if nosync
+            if self.reverse:
+                is_nosync = target.id in self.kernel.get_nosync_set(
+                        source_id, scope=self.var_kind)
+            else:
+                is_nosync = source_id in self.kernel.get_nosync_set(
+                        target.id, scope=self.var_kind)
+
+            dep_descr = (None if is_nosync
+                    else self.describe_dependency(source_id, target))
+
+            source_id_to_dep_descr[source_id] = dep_descr
+            return dep_descr
+
         tgt_accessed_vars = dir_to_getter[tgt_dir](target)
         tgt_accessed_vars_base = self.map_to_base_storage(tgt_accessed_vars)
 
         for race_var_base in sorted(tgt_accessed_vars_base):
+            tgt_race_vars = filter_var_set_for_base_storage(
+                    tgt_accessed_vars, race_var_base)
+
             for source_id in sorted(
                     src_base_var_to_accessor_map[race_var_base]):
-
-                # {{{ no barrier if nosync
-
-                if (not self.reverse and source_id in
-                        self.kernel.get_nosync_set(target.id, scope=self.var_kind)):
-                    continue
-                if (self.reverse and target.id in
-                        self.kernel.get_nosync_set(source_id, scope=self.var_kind)):
-                    continue
-
-                # }}}
-
-                dep_descr = self.describe_dependency(source_id, target)
+                dep_descr = get_dep_descr(source_id)
                 if dep_descr is None:
                     continue
 
                 source = self.kernel.id_to_insn[source_id]
                 src_race_vars = filter_var_set_for_base_storage(
                         dir_to_getter[src_dir](source), race_var_base)
-                tgt_race_vars = filter_var_set_for_base_storage(
-                        tgt_accessed_vars, race_var_base)
 
                 race_var = race_var_base
 
@@ -25,7 +25,7 @@ import enum
 from typing import Sequence, FrozenSet, Tuple, List, Set, Dict
 from dataclasses import dataclass
 
-from pytools import memoize_method
+from pytools import memoize_method, memoize_on_first_arg
 import islpy as isl
 
 from loopy.kernel.data import AddressSpace, TemporaryVariable, ArrayArg
@@ -335,6 +335,135 @@ def get_return_from_kernel_mapping(kernel):
 
 # {{{ check for write races in accesses
 
+@memoize_on_first_arg
+def _get_hw_id_comparison_sets(knl, space, set_dim_names, lsize_axes,
+                               gsize_axes):
+    """
+    Returns a tuple ``(unequal_local_id_set, unequal_group_id_set,
+    equal_group_id_set)`` of sets in *space* comparing the hardware ids of the
+    two execution instances ``A`` and ``B`` considered by
+    :func:`_check_for_access_races`. These depend only on *space* and are thus
+    shared by all pairs of accesses whose preprocessed maps live in it.
+
+    :arg set_dim_names: the names of *space*'s set dimensions. Only used as
+        part of the memoization key, since :class:`islpy.Space` equality
+        disregards set dimension names.
+    """
+    import pymbolic.primitives as p
+    from loopy.symbolic import isl_set_from_expr
+
+    unequal_local_id_set = isl.Set.empty(space)
+    unequal_group_id_set = isl.Set.empty(space)
+    equal_group_id_set = isl.BasicSet.universe(space)
+
+    for i_l in lsize_axes:
+        lid_a = p.Variable(f"l.{i_l}.A")
+        lid_b = p.Variable(f"l.{i_l}.B")
+        unequal_local_id_set |= (isl_set_from_expr(space,
+                                                   p.Comparison(lid_a, "!=", lid_b))
+                                 )
+
+    for i_g in gsize_axes:
+        gid_a = p.Variable(f"g.{i_g}.A")
+        gid_b = p.Variable(f"g.{i_g}.B")
+        unequal_group_id_set |= (isl_set_from_expr(space,
+                                                   p.Comparison(gid_a, "!=", gid_b))
+                                 )
+        equal_group_id_set &= (isl_set_from_expr(space,
+                                                 p.Comparison(gid_a, "==", gid_b))
+                               )
+
+    return unequal_local_id_set, unequal_group_id_set, equal_group_id_set
+
+
+@memoize_on_first_arg
+def _preprocess_access_map_for_race_check(knl, map_, in_dim_names,
+                                          within_inames, lsize_axes, gsize_axes,
+                                          hw_id_suffix):
+    """
+    Returns *map_*, an access map of an instruction nested within
+    *within_inames*, brought into the form expected by
+    :func:`_check_for_access_races` (see Steps 1 to 3 there). Memoized so that
+    an access taking part in several candidate races is only processed once.
+
+    :arg in_dim_names: the names of *map_*'s input dimensions. Only used as
+        part of the memoization key, since :class:`islpy.Map` equality
+        disregards dimension names while the result depends on them.
+    :arg hw_id_suffix: appended to the names of the hardware id dimensions,
+        i.e. ``".A"`` or ``".B"``.
+    """
+    import pymbolic.primitives as p
+    from loopy.symbolic import aff_from_expr, aff_to_expr
+    from loopy.kernel.data import filter_iname_tags_by_type, HardwareConcurrentTag
+    from loopy.kernel.tools import get_hw_axis_base_for_codegen
+
+    dims_not_to_project_out = ({iname
+                                for iname in within_inames
+                                if knl.iname_tags_of_type(
+                                    iname, HardwareConcurrentTag)}
+                               | knl.all_params())
+    map_ = map_.project_out_except(sorted(dims_not_to_project_out),
+                                   [isl.dim_type.in_,
+                                    isl.dim_type.param,
+                                    isl.dim_type.div,
+                                    isl.dim_type.cst])
+
+    for name, (dt, pos) in map_.get_var_dict().items():
+        if dt == isl.dim_type.in_:
+            tag, = filter_iname_tags_by_type(knl.inames[name].tags,
+                                             HardwareConcurrentTag)
+
+            iname_lower_bound = get_hw_axis_base_for_codegen(knl, name)
+
+            if not iname_lower_bound.plain_is_zero():
+                # Hardware inames with nonzero base have an offset applied in
+                # code generation:
+                # https://github.com/inducer/loopy/blob/4e0b1c7635afe1473c8636377f8e7ef6d78dfd46/loopy/codegen/loop.py#L293-L297
+                # https://github.com/inducer/loopy/issues/600#issuecomment-1104066735
+
+                map_ = map_.add_dims(isl.dim_type.out, 1)
+                map_ = map_.move_dims(
+                    isl.dim_type.in_, pos+1,
+                    isl.dim_type.out, map_.dim(isl.dim_type.out)-1,
+                    1
+                )
+                map_ = map_.set_dim_name(isl.dim_type.in_, pos+1, name+"'")
+
+                lbound_offset_expr_aff = aff_from_expr(
+                    map_.domain().space,
+                    (p.Variable(name+"'")
+                     + aff_to_expr(iname_lower_bound)
+                     - p.Variable(name))
+                )
+                lbound_offset_as_domain = lbound_offset_expr_aff.zero_basic_set()
+                map_ = map_.intersect_domain(lbound_offset_as_domain)
+
+                map_ = map_.project_out(dt, pos, 1)
+                assert map_.get_dim_name(dt, pos) == name+"'"
+                map_ = map_.set_dim_name(dt, pos, name)
+
+            map_ = map_.set_dim_name(dt, pos, f"{tag}{hw_id_suffix}")
+
+    for i_l in lsize_axes:
+        if f"l.{i_l}{hw_id_suffix}" not in map_.get_var_dict():
+            ndim = map_.dim(isl.dim_type.in_)
+            map_ = map_.add_dims(isl.dim_type.in_, 1)
+            map_ = map_.set_dim_name(isl.dim_type.in_, ndim,
+                                     f"l.{i_l}{hw_id_suffix}")
+
+    for i_g in gsize_axes:
+        if f"g.{i_g}{hw_id_suffix}" not in map_.get_var_dict():
+            ndim = map_.dim(isl.dim_type.in_)
+            map_ = map_.add_dims(isl.dim_type.in_, 1)
+            map_ = map_.set_dim_name(isl.dim_type.in_, ndim,
+                                     f"g.{i_g}{hw_id_suffix}")
+
+    for pos in range(map_.dim(isl.dim_type.out)):
+        map_ = map_.set_dim_name(isl.dim_type.out, pos, f"_lp_dim{pos}")
+
+    return map_
+
+
 def _check_for_access_races(map_a, insn_a, map_b, insn_b, knl, callables_table,
                             address_space):
     """
@@ -349,12 +478,7 @@ def _check_for_access_races(map_a, insn_a, map_b, insn_b, knl, callables_table,
         The accesses ``map_a``, ``map_b`` lead to write races iff there exists 2
         *unequal* global ids that access the same address.
     """
-    import pymbolic.primitives as p
-    from loopy.symbolic import isl_set_from_expr, aff_from_expr, aff_to_expr
-    from loopy.kernel.data import (filter_iname_tags_by_type,
-                                   HardwareConcurrentTag,
-                                   AddressSpace)
-    from loopy.kernel.tools import get_hw_axis_base_for_codegen
+    from loopy.kernel.data import AddressSpace
 
     assert address_space in [AddressSpace.LOCAL, AddressSpace.GLOBAL]
 
@@ -369,146 +493,54 @@ def _check_for_access_races(map_a, insn_a, map_b, insn_b, knl, callables_table,
     # Step 1.3: Project out sequential inames in the access maps
     # Step 1.4: Rename the dims with their iname tags i.e. (g.i or l.i)
     # Step 1.5: Name the ith output dims as _lp_dim{i}
-
-    updated_maps = []
-
-    for (map_, insn) in [
-            (map_a, insn_a),
-            (map_b, insn_b)]:
-        dims_not_to_project_out = ({iname
-                                    for iname in insn.within_inames
-                                    if knl.iname_tags_of_type(
-                                        iname, HardwareConcurrentTag)}
-                                   | knl.all_params())
-        map_ = map_.project_out_except(sorted(dims_not_to_project_out),
-                                       [isl.dim_type.in_,
-                                        isl.dim_type.param,
-                                        isl.dim_type.div,
-                                        isl.dim_type.cst])
-
-        for name, (dt, pos) in map_.get_var_dict().items():
-            if dt == isl.dim_type.in_:
-                tag, = filter_iname_tags_by_type(knl.inames[name].tags,
-                                                 HardwareConcurrentTag)
-
-                iname_lower_bound = get_hw_axis_base_for_codegen(knl, name)
-
-                if not iname_lower_bound.plain_is_zero():
-                    # Hardware inames with nonzero base have an offset applied in
-                    # code generation:
-                    # https://github.com/inducer/loopy/blob/4e0b1c7635afe1473c8636377f8e7ef6d78dfd46/loopy/codegen/loop.py#L293-L297
-                    # https://github.com/inducer/loopy/issues/600#issuecomment-1104066735
-
-                    map_ = map_.add_dims(isl.dim_type.out, 1)
-                    map_ = map_.move_dims(
-                        isl.dim_type.in_, pos+1,
-                        isl.dim_type.out, map_.dim(isl.dim_type.out)-1,
-                        1
-                    )
-                    map_ = map_.set_dim_name(isl.dim_type.in_, pos+1, name+"'")
-
-                    lbound_offset_expr_aff = aff_from_expr(
-                        map_.domain().space,
-                        (p.Variable(name+"'")
-                         + aff_to_expr(iname_lower_bound)
-                         - p.Variable(name))
-                    )
-                    lbound_offset_as_domain = lbound_offset_expr_aff.zero_basic_set()
-                    map_ = map_.intersect_domain(lbound_offset_as_domain)
-
-                    map_ = map_.project_out(dt, pos, 1)
-                    assert map_.get_dim_name(dt, pos) == name+"'"
-                    map_ = map_.set_dim_name(dt, pos, name)
-
-                map_ = map_.set_dim_name(dt, pos, str(tag))
-
-        for i_l in lsize:
-            if f"l.{i_l}" not in map_.get_var_dict():
-                ndim = map_.dim(isl.dim_type.in_)
-                map_ = map_.add_dims(isl.dim_type.in_, 1)
-                map_ = map_.set_dim_name(isl.dim_type.in_, ndim, f"l.{i_l}")
-
-        for i_g in gsize:
-            if f"g.{i_g}" not in map_.get_var_dict():
-                ndim = map_.dim(isl.dim_type.in_)
-                map_ = map_.add_dims(isl.dim_type.in_, 1)
-                map_ = map_.set_dim_name(isl.dim_type.in_, ndim, f"g.{i_g}")
-
-        for pos in range(map_.dim(isl.dim_type.out)):
-            map_ = map_.set_dim_name(isl.dim_type.out, pos, f"_lp_dim{pos}")
-
-        updated_maps.append(map_)
-
-    map_a, map_b = updated_maps
-
-    # }}}
-
-    # {{{ Step 2: rename all lid's, gid's in map_a to lid.A, gid.A
-
-    for name, (dt, pos) in map_a.get_var_dict().items():
-        if dt == isl.dim_type.in_:
-            map_a = map_a.set_dim_name(dt, pos, name+".A")
-
-    # }}}
-
-    # {{{ Step 3: rename all lid's, gid's in map_b to lid.B, gid.B
-
-    for name, (dt, pos) in map_b.get_var_dict().items():
-        if dt == isl.dim_type.in_:
-            map_b = map_b.set_dim_name(dt, pos, name+".B")
+    #
+    # Step 2: rename all lid's, gid's in map_a to lid.A, gid.A
+    # Step 3: rename all lid's, gid's in map_b to lid.B, gid.B
+    #
+    # Steps 2 and 3 are folded into Step 1.4, so that each dim is named once.
+
+    map_a, map_b = (
+            _preprocess_access_map_for_race_check(
+                knl, map_, tuple(map_.get_var_names(isl.dim_type.in_)),
+                insn.within_inames, tuple(lsize), tuple(gsize), hw_id_suffix)
+            for map_, insn, hw_id_suffix in [(map_a, insn_a, ".A"),
+                                             (map_b, insn_b, ".B")])
 
     # }}}
 
     # {{{ Step 4: make map_a, map_b ISL sets
 
+    # wrap + flatten yields the set [in, out] directly, without moving the
+    # output dims into the domain first.
     map_a, map_b = isl.align_two(map_a, map_b)
-    map_a = map_a.move_dims(isl.dim_type.in_, map_a.dim(isl.dim_type.in_),
-                            isl.dim_type.out, 0, map_a.dim(isl.dim_type.out))
-
-    map_b = map_b.move_dims(isl.dim_type.in_, map_b.dim(isl.dim_type.in_),
-                            isl.dim_type.out, 0, map_b.dim(isl.dim_type.out))
-    set_a = map_a.domain()
-    set_b = map_b.domain()
+    set_a = map_a.wrap().flatten()
+    set_b = map_b.wrap().flatten()
 
     # }}}
 
     assert set_a.get_space() == set_b.get_space()
 
-    # {{{ Step 5: create the set any(l.i.A != l.i.B) OR any(g.i.A != g.i.B)
-
-    space = set_a.space
-    unequal_local_id_set = isl.Set.empty(set_a.get_space())
-    unequal_group_id_set = isl.Set.empty(set_a.get_space())
-    equal_group_id_set = isl.BasicSet.universe(set_a.get_space())
+    common_accesses = set_a & set_b
+    if common_accesses.plain_is_empty():
+        # the accesses obviously never touch the same address
+        return False
 
-    for i_l in lsize:
-        lid_a = p.Variable(f"l.{i_l}.A")
-        lid_b = p.Variable(f"l.{i_l}.B")
-        unequal_local_id_set |= (isl_set_from_expr(space,
-                                                   p.Comparison(lid_a, "!=", lid_b))
-                                 )
+    # {{{ Step 5: create the set any(l.i.A != l.i.B) OR any(g.i.A != g.i.B)
 
-    for i_g in gsize:
-        gid_a = p.Variable(f"g.{i_g}.A")
-        gid_b = p.Variable(f"g.{i_g}.B")
-        unequal_group_id_set |= (isl_set_from_expr(space,
-                                                   p.Comparison(gid_a, "!=", gid_b))
-                                 )
-        equal_group_id_set &= (isl_set_from_expr(space,
-                                                 p.Comparison(gid_a, "==", gid_b))
-                               )
+    (unequal_local_id_set, unequal_group_id_set,
+     equal_group_id_set) = _get_hw_id_comparison_sets(
+             knl, set_a.space, tuple(set_a.get_var_names(isl.dim_type.set)),
+             tuple(lsize), tuple(gsize))
 
     # }}}
 
     if address_space == AddressSpace.GLOBAL:
-        return not (set_a
-                    & set_b
+        return not (common_accesses
                     & (unequal_local_id_set
                        | unequal_group_id_set)
                     ).is_empty()
     else:
-        return not (set_a
-                    & set_b
+        return not (common_accesses
                     & unequal_local_id_set
                     & equal_group_id_set).is_empty()
 
@@ -536,6 +568,11 @@ class WriteRaceChecker:
         return (self.kernel.get_written_variables()
                 | self.kernel.get_read_variables())
 
+    @cached_property
+    def _array_vars(self):
+        from loopy.symbolic import get_array_var_names
+        return get_array_var_names(self.kernel, self.vars)
+
     @memoize_method
     def _get_access_maps(self, insn_id, access_dir):
         from loopy.symbolic import BatchedAccessMapMapper
@@ -550,6 +587,9 @@ class WriteRaceChecker:
 
         access_maps = defaultdict(lambda: AccessMapDescriptor.DOES_NOT_ACCESS)
 
+        if not (insn.dependency_names() & self._array_vars):
+            return access_maps
+
         arm = BatchedAccessMapMapper(self.kernel, self.vars, overestimate=True)
 
         for expr in exprs:
@@ -559,7 +599,7 @@ class WriteRaceChecker:
             if arm.bad_subscripts[name]:
                 access_maps[name] = AccessMapDescriptor.NON_AFFINE_ACCESS
                 continue
-            access_maps[name] = arm.access_maps[name][insn.within_inames]
+            access_maps[name] = arm.access_maps[name].get(insn.within_inames)
 
         return access_maps
 
@@ -1438,7 +1438,19 @@ def count(kernel, set, space=None):
 
         bset_strides = get_simple_strides(bset, key_by="index")
 
-        for i in range(bset.dim(isl.dim_type.set)):
+        # {{{ loop-invariant pieces of the check domain
+
+        n_set_dims = bset.dim(isl.dim_type.set)
+        zero = isl.Aff.zero_on_domain(
+                    isl.LocalSpace.from_space(bset.space))
+        set_dim_ids = [
+                (idx, bset.get_dim_id(isl.dim_type.set, idx))
+                for idx in range(n_set_dims)
+                if bset.has_dim_id(isl.dim_type.set, idx)]
+
+        # }}}
+
+        for i in range(n_set_dims):
             dmax = bset.dim_max(i)
             dmin = bset.dim_min(i)
 
@@ -1460,21 +1472,17 @@ def count(kernel, set, space=None):
 
             # {{{ rebuild check domain
 
-            zero = isl.Aff.zero_on_domain(
-                        isl.LocalSpace.from_space(bset.space))
             iname = isl.PwAff.from_aff(
                     zero.set_coefficient_val(isl.dim_type.in_, i, 1))
             dmin_matched = dmin.insert_dims(
-                    dim_type.in_, 0, bset.dim(isl.dim_type.set))
+                    dim_type.in_, 0, n_set_dims)
             dmax_matched = dmax.insert_dims(
-                    dim_type.in_, 0, bset.dim(isl.dim_type.set))
-            for idx in range(bset.dim(isl.dim_type.set)):
-                if bset.has_dim_id(isl.dim_type.set, idx):
-                    dim_id = bset.get_dim_id(isl.dim_type.set, idx)
-                    dmin_matched = dmin_matched.set_dim_id(
-                            isl.dim_type.in_, idx, dim_id)
-                    dmax_matched = dmax_matched.set_dim_id(
-                            isl.dim_type.in_, idx, dim_id)
+                    dim_type.in_, 0, n_set_dims)
+            for idx, dim_id in set_dim_ids:
+                dmin_matched = dmin_matched.set_dim_id(
+                        isl.dim_type.in_, idx, dim_id)
+                dmax_matched = dmax_matched.set_dim_id(
+                        isl.dim_type.in_, idx, dim_id)
 
             bset_rebuilt = (
                     bset_rebuilt
@@ -2451,35 +2451,55 @@ def get_access_map(domain, subscript, assumptions=None, shape=None,
         >>> Map("[n]->{[i, j]->[i+1, j]: 0<=i<n and i<=j<n}")
     """
 
+    return _get_access_map_from_domain(
+            _get_access_map_domain(domain, assumptions, allowed_constant_names),
+            subscript, shape)
+
+
+def _get_access_map_domain(domain, assumptions=None, allowed_constant_names=None):
+    """
+    Returns an :class:`isl.Set` for *domain* restricted to *assumptions* and
+    with *allowed_constant_names* added as parameters. The result only depends
+    on the iteration domain and may thus be shared by all access maps
+    over it. See :func:`get_access_map` for the meaning of the arguments.
+    """
     if assumptions is not None:
         domain, assumptions = isl.align_two(domain,
                 assumptions)
         domain = domain & assumptions
         del assumptions
 
-    dims = len(subscript)
-
-    # we build access_map as a set because (idiocy!) Affs
-    # cannot live on maps.
-
-    # dims: [domain](dn)[storage]
-    access_map = domain
-
-    if isinstance(access_map, isl.BasicSet):
-        access_map = isl.Set.from_basic_set(access_map)
+    if isinstance(domain, isl.BasicSet):
+        domain = isl.Set.from_basic_set(domain)
 
     if allowed_constant_names is not None:
         allowed_constant_names = set(allowed_constant_names) - {
-                access_map.get_dim_name(dim_type.param, i)
-                for i in range(access_map.dim(dim_type.param))}
+                domain.get_dim_name(dim_type.param, i)
+                for i in range(domain.dim(dim_type.param))}
 
-        par_base = access_map.dim(dim_type.param)
-        access_map = access_map.insert_dims(dim_type.param, par_base,
+        par_base = domain.dim(dim_type.param)
+        domain = domain.insert_dims(dim_type.param, par_base,
                 len(allowed_constant_names))
         for i, const_name in enumerate(allowed_constant_names):
-            access_map = access_map.set_dim_name(
+            domain = domain.set_dim_name(
                     dim_type.param, par_base+i, const_name)
 
+    return domain
+
+
+def _get_access_map_from_domain(domain, subscript, shape=None):
+    """
+    Returns the access map of *subscript* over *domain*, as obtained from
+    :func:`_get_access_map_domain`.
+    """
+    dims = len(subscript)
+
+    # we build access_map as a set because (idiocy!) Affs
+    # cannot live on maps.
+
+    # dims: [domain](dn)[storage]
+    access_map = domain
+
     dn = access_map.dim(dim_type.set)
     access_map = access_map.insert_dims(dim_type.set, dn, dims)
 
@@ -2529,8 +2549,7 @@ def get_access_map(domain, subscript, assumptions=None, shape=None,
             access_map = access_map.add_constraint(
                     isl.Constraint.equality_from_aff(idx_aff))
 
-    access_map_as_map = isl.Map.universe(access_map.get_space())
-    access_map_as_map = access_map_as_map.intersect_range(access_map)
+    access_map_as_map = isl.Map.from_range(access_map)
     access_map = access_map_as_map.move_dims(
             dim_type.in_, 0,
             dim_type.out, 0, dn)
@@ -2551,19 +2570,56 @@ def get_access_range(domain, subscript, assumptions=None, shape=None,
 
 # {{{ access range mapper
 
+def get_array_var_names(kernel, var_names):
+    """
+    Returns a :class:`frozenset` of the names in *var_names* that may be
+    accessed through a subscript, i.e. arrays not known to be of shape ``()``.
+    Instructions not referencing any of these have no access maps. Inames and
+    value arguments are excluded, names that are not (yet) known as variables
+    of *kernel* are kept.
+    """
+    from loopy.kernel.array import ArrayBase
+
+    all_inames = kernel.all_inames()
+    result = set()
+
+    for name in var_names:
+        if name in all_inames:
+            continue
+
+        descr = kernel.temporary_variables.get(name, kernel.arg_dict.get(name))
+        if descr is None or (isinstance(descr, ArrayBase) and descr.shape != ()):
+            result.add(name)
+
+    return frozenset(result)
+
+
 class BatchedAccessMapMapper(WalkMapper):
 
     def __init__(self, kernel, var_names, overestimate=False):
         self.kernel = kernel
         from collections import defaultdict
-        self.access_maps = defaultdict(lambda: defaultdict(lambda: None))
+        self.access_maps = {}
         self.bad_subscripts = defaultdict(list)
         self._overestimate = overestimate
         self._var_names = set(var_names)
         super().__init__()
 
+    @memoize_method
+    def _get_domain_for_inames(self, inames):
+        # shared by all subscripts accessed within *inames*
+        return _get_access_map_domain(
+                self.kernel.get_inames_domain(inames),
+                self.kernel.assumptions,
+                allowed_constant_names=self.kernel.get_unwritten_value_args())
+
+    @memoize_method
+    def _get_access_map(self, inames, subscript, shape):
+        return _get_access_map_from_domain(
+                self._get_domain_for_inames(inames), subscript, shape)
+
     def get_access_range(self, var_name):
-        loops_to_amaps = self.access_maps[var_name]
+        loops_to_amaps = self.access_maps.get(var_name)
         if not loops_to_amaps:
             return None
 
@@ -2572,7 +2628,6 @@ class BatchedAccessMapMapper(WalkMapper):
         return reduce(operator.or_, (val.range() for val in loops_to_amaps.values()))
 
     def map_subscript(self, expr, inames):
-        domain = self.kernel.get_inames_domain(inames)
         WalkMapper.map_subscript(self, expr, inames)
 
         assert isinstance(expr.aggregate, p.Variable)
@@ -2589,18 +2644,19 @@ class BatchedAccessMapMapper(WalkMapper):
         descriptor = self.kernel.get_var_descriptor(arg_name)
 
         try:
-            access_map = get_access_map(
-                    domain, subscript, self.kernel.assumptions,
-                    shape=descriptor.shape if self._overestimate else None,
-                    allowed_constant_names=self.kernel.get_unwritten_value_args())
+            access_map = self._get_access_map(
+                    inames, subscript,
+                    descriptor.shape if self._overestimate else None)
         except UnableToDetermineAccessRangeError:
             self.bad_subscripts[arg_name].append(expr)
             return
 
         # {{{ check that the access' dimensionality matches previously seen accesses
 
-        if self.access_maps[arg_name]:
-            other_access_map = next(iter(self.access_maps[arg_name].values()))
+        inames_to_amaps = self.access_maps.setdefault(arg_name, {})
+
+        if inames_to_amaps:
+            other_access_map = next(iter(inames_to_amaps.values()))
 
             if (other_access_map.dim(dim_type.set)
                     != access_map.dim(dim_type.set)):
@@ -2611,10 +2667,11 @@ class BatchedAccessMapMapper(WalkMapper):
 
         # }}}
 
-        if self.access_maps[arg_name][inames] is None:
-            self.access_maps[arg_name][inames] = access_map
+        prev_access_map = inames_to_amaps.get(inames)
+        if prev_access_map is None:
+            inames_to_amaps[inames] = access_map
         else:
-            self.access_maps[arg_name][inames] |= access_map
+            inames_to_amaps[inames] = prev_access_map | access_map
 
     def map_linear_subscript(self, expr, inames):
         self.rec(expr.index, inames)
@@ -2637,23 +2694,25 @@ class BatchedAccessMapMapper(WalkMapper):
             return
 
         total_inames = inames | {iname.name for iname in expr.swept_inames}
-        assert total_inames not in self.access_maps[arg_name]
+        assert total_inames not in self.access_maps.get(arg_name, {})
 
         self.rec(expr.subscript, total_inames)
 
         # {{{ project out swept_inames as within inames they are swept locally
 
-        amap = self.access_maps[arg_name].pop(total_inames)
+        inames_to_amaps = self.access_maps[arg_name]
+        amap = inames_to_amaps.pop(total_inames)
         for iname in expr.swept_inames:
             dt, pos = amap.get_var_dict()[iname.name]
             amap = amap.project_out(dt, pos, 1)
 
         # }}}
 
-        if self.access_maps[arg_name][inames] is None:
-            self.access_maps[arg_name][inames] = amap
+        prev_amap = inames_to_amaps.get(inames)
+        if prev_amap is None:
+            inames_to_amaps[inames] = amap
         else:
-            self.access_maps[arg_name][inames] |= amap
+            inames_to_amaps[inames] = prev_amap | amap
 
 
 class AccessRangeMapper:
@@ -2702,6 +2761,10 @@ class AccessRangeOverlapChecker:
         return (self.kernel.get_written_variables()
                 | self.kernel.get_read_variables())
 
+    @cached_property
+    def _array_vars(self):
+        return get_array_var_names(self.kernel, self.vars)
+
     @memoize_method
     def _get_access_ranges(self, insn_id, access_dir):
         insn = self.kernel.id_to_insn[insn_id]
@@ -2714,6 +2777,9 @@ class AccessRangeOverlapChecker:
         from collections import defaultdict
         aranges = defaultdict(lambda: False)
 
+        if not (insn.dependency_names() & self._array_vars):
+            return aranges
+
         arm = BatchedAccessMapMapper(self.kernel, self.vars, overestimate=True)
 
         for expr in exprs:
@@ -724,26 +724,26 @@ def _kernel_to_python(kernel, is_entrypoint=False, var_name="kernel"):
     options = {}  # options: mapping from insn_id to str of options
 
     for insn in kernel.instructions:
-        option = f"id={insn.id}, "
+        option = [f"id={insn.id}"]
         if insn.depends_on:
-            option += ("dep="+":".join(insn.depends_on)+", ")
+            option.append("dep="+":".join(insn.depends_on))
         if insn.tags:
-            option += ("tags="+":".join(insn.tags)+", ")
+            option.append("tags="+":".join(insn.tags))
         if insn.within_inames is not None:
             if insn.within_inames_is_final:
-                option += ("inames="+":".join(insn.within_inames)+", ")
+                option.append("inames="+":".join(insn.within_inames))
             else:
-                option += ("inames=+"+":".join(insn.within_inames)+", ")
+                option.append("inames=+"+":".join(insn.within_inames))
 
         if isinstance(insn, MultiAssignmentBase):
             if insn.atomicity:
-                option += "atomic, "
+                option.append("atomic")
         elif isinstance(insn, BarrierInstruction):
-            option += (f"mem_kind={insn.mem_kind}, ")
+            option.append(f"mem_kind={insn.mem_kind}")
         else:
             pass
 
-        options[insn.id] = option[:-2]  # get rid of the trailing ", "
+        options[insn.id] = ", ".join(option)
 
     make_kernel = "make_kernel" if is_entrypoint else "make_function"
 
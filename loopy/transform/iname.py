@@ -2339,11 +2339,12 @@ def add_inames_for_unused_hw_axes(kernel, within=None):
             missing_group_axes = [i for i in range(n_group_axes)
                     if GroupInameTag(i) not in within_tags]
 
+            new_inames = set()
+
             for axis in missing_local_axes:
                 iname = local_axes_to_inames[axis]
                 if iname:
-                    insn = insn.copy(within_inames=insn.within_inames |
-                            frozenset([iname]))
+                    new_inames.add(iname)
                 else:
                     raise LoopyError("Multiple inames tagged with l.%d while"
                             " adding unused local hw axes to instruction '%s'."
@@ -2352,13 +2353,16 @@ def add_inames_for_unused_hw_axes(kernel, within=None):
             for axis in missing_group_axes:
                 iname = group_axes_to_inames[axis]
                 if iname is not None:
-                    insn = insn.copy(within_inames=insn.within_inames |
-                            frozenset([iname]))
+                    new_inames.add(iname)
                 else:
                     raise LoopyError("Multiple inames tagged with g.%d while"
                             " adding unused group hw axes to instruction '%s'."
                             % (axis, insn.id))
 
+            if new_inames:
+                insn = insn.copy(within_inames=insn.within_inames
+                        | frozenset(new_inames))
+
         new_insns.append(insn)
 
     return kernel.copy(instructions=new_insns)
@@ -2587,6 +2587,31 @@ def test_check_for_variable_access_ordering_with_aliasing():
         lp.generate_code_v2(knl)
 
 
+def test_check_bounds_with_renamed_equal_domains():
+    # The domains of both instructions are equal up to the names of their
+    # inames, the out-of-bounds access in the second one must still be found.
+    from loopy.diagnostic import LoopyIndexError
+
+    knl = lp.make_kernel(
+            ["{[i]: 0<=i<n}", "{[j]: 0<=j<n}"],
+            """
+            if i != 3
+                a[i] = 1
+            end
+            if j != 3
+                b[j+1] = 2
+            end
+            """,
+            [
+                lp.GlobalArg("a,b", dtype=np.float32, shape="n"),
+                lp.ValueArg("n", dtype=np.int32),
+                ],
+            assumptions="n>=5")
+
+    with pytest.raises(LoopyIndexError):
+        lp.generate_code_v2(knl)
+
+
 @pytest.mark.parametrize(("second_index", "expect_barrier"),
         [
             ("2*i", False),
@@ -2614,6 +2639,66 @@ def test_no_barriers_for_nonoverlapping_access(second_index, expect_barrier):
     assert barrier_between(knl, "first", "second") == expect_barrier
 
 
+def test_access_checkers_with_scalar_only_instruction(monkeypatch):
+    import loopy.symbolic
+    from loopy.symbolic import AccessRangeOverlapChecker
+    from loopy.schedule.tools import WriteRaceChecker
+
+    prog = lp.make_kernel(
+            "{[i]: 0<=i<16}",
+            """
+            <> s = n  {id=scalar}
+            a[i] = s  {id=fwd,dep=scalar}
+            b[i] = a[15-i]  {id=rev,dep=fwd}
+            """,
+            [
+                lp.TemporaryVariable("a", dtype=np.float32, shape=(16,),
+                    address_space=lp.AddressSpace.LOCAL),
+                lp.GlobalArg("b", dtype=np.float32, shape=(16,)),
+                lp.ValueArg("n", dtype=np.int32),
+                ])
+
+    prog = lp.tag_inames(prog, "i:l.0")
+    prog = lp.preprocess_kernel(prog)
+    knl = prog["loopy_kernel"]
+
+    n_mappers = [0]
+
+    class CountingBatchedAccessMapMapper(loopy.symbolic.BatchedAccessMapMapper):
+        def __init__(self, *args, **kwargs):
+            n_mappers[0] += 1
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(loopy.symbolic, "BatchedAccessMapMapper",
+            CountingBatchedAccessMapMapper)
+
+    # 'scalar' only touches a scalar temporary and a value argument, its
+    # accesses must be determined without walking it
+    aroc = AccessRangeOverlapChecker(knl)
+    assert not aroc.do_access_ranges_overlap_conservative(
+            "scalar", "w", "scalar", "any", "s")
+    wrc = WriteRaceChecker(knl, prog.callables_table)
+    assert not wrc.do_accesses_result_in_races(
+            "scalar", "w", "scalar", "any", "s")
+    assert n_mappers[0] == 0
+
+    assert not aroc.do_access_ranges_overlap_conservative(
+            "scalar", "w", "fwd", "any", "s")
+    assert not aroc.do_access_ranges_overlap_conservative(
+            "scalar", "any", "fwd", "w", "a")
+    assert aroc.do_access_ranges_overlap_conservative(
+            "fwd", "w", "rev", "any", "a")
+
+    assert not wrc.do_accesses_result_in_races(
+            "scalar", "w", "fwd", "any", "s")
+    assert not wrc.do_accesses_result_in_races(
+            "scalar", "any", "fwd", "w", "a")
+    assert wrc.do_accesses_result_in_races(
+            "fwd", "w", "rev", "any", "a")
+
+    assert n_mappers[0] > 0
+
+
 def test_half_complex_conditional(ctx_factory):
     ctx = ctx_factory()
     queue = cl.CommandQueue(ctx)